@@ -2,9 +2,10 @@ import os
 import re
 import argparse
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, List, Any
 from generate_shared import (
     load_parsed_translations,
+    iter_translations,
     clean_string,
     print_progress,
     print_success,
@@ -32,7 +33,7 @@ def convert_placeholders(text: str) -> str:
 
 
 def generate_android_xml(
-    translations: Dict[str, Any],
+    translations: Dict[str, List[Any]],
     app_name: str | None,
     glossary_dict: Dict[str, str]
 ) -> str:
@@ -40,30 +41,30 @@ def generate_android_xml(
     Generate Android strings.xml content from translations.
     
     Args:
-        translations: Dictionary of translations
+        translations: Parsed translations for the locale
         app_name: App name to include (only for source language)
         glossary_dict: Dictionary for string cleaning
         
     Returns:
         XML string content
     """
-    sorted_translations = sorted(translations.items())
+    sorted_translations = sorted(iter_translations(translations), key=lambda entry: entry[0])
     result = '<?xml version="1.0" encoding="utf-8"?>\n'
     result += '<resources>\n'
     
     if app_name is not None:
         result += f'    <string name="app_name" translatable="false">{app_name}</string>\n'
     
-    for resname, trans_data in sorted_translations:
-        if trans_data['type'] == 'plural':
+    for resname, trans_type, trans_value in sorted_translations:
+        if trans_type == 'plural':
             result += f'    <plurals name="{resname}">\n'
-            for form, value in trans_data['forms'].items():
+            for form, value in trans_value.items():
                 escaped_value = clean_string(convert_placeholders(value), True, glossary_dict, {})
                 result += f'        <item quantity="{form}">{escaped_value}</item>\n'
             result += '    </plurals>\n'
         else:
             # Regular strings: DON'T convert placeholders
-            escaped_target = clean_string(trans_data['value'], True, glossary_dict, {})
+            escaped_target = clean_string(trans_value, True, glossary_dict, {})
             result += f'    <string name="{resname}">{escaped_target}</string>\n'
     
     result += '</resources>'
@@ -71,7 +72,7 @@ def generate_android_xml(
 
 
 def write_android_xml(
-    translations: Dict[str, Any],
+    translations: Dict[str, List[Any]],
     output_dir: str,
     source_locale: str,
     locale: str,
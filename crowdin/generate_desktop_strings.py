@@ -6,6 +6,7 @@ from pathlib import Path
 from typing import Dict, List, Any
 from generate_shared import (
     load_parsed_translations,
+    iter_translations,
     clean_string,
     print_progress,
     print_success,
@@ -38,30 +39,27 @@ def snake_to_camel(snake_str: str) -> str:
     return parts[0].lower() + ''.join(word.capitalize() for word in parts[1:])
 
 
-def generate_icu_pattern(trans_data: Dict[str, Any] | str, glossary_dict: Dict[str, str]) -> str:
+def generate_icu_pattern(value: Dict[str, str] | str, glossary_dict: Dict[str, str], is_plural: bool = False) -> str:
     """
     Generate an ICU pattern from translation data.
     
     Args:
-        trans_data: Either a dict with 'type' and 'forms'/'value', or a raw string
+        value: Either a dict of plural forms, or a string (including raw glossary strings)
         glossary_dict: Dictionary of non-translatable strings
+        is_plural: Whether the value is a dict of plural forms
         
     Returns:
         ICU-formatted string
     """
-    # Handle raw strings (from glossary)
-    if isinstance(trans_data, str):
-        return clean_string(trans_data, False, glossary_dict, {})
-    
-    if trans_data['type'] == 'plural':
+    if is_plural:
         pattern_parts = []
-        for form, value in trans_data['forms'].items():
+        for form, form_value in value.items():
             if form in ['zero', 'one', 'two', 'few', 'many', 'other', 'exact', 'fractional']:
-                cleaned_value = clean_string(value, False, glossary_dict, {})
+                cleaned_value = clean_string(form_value, False, glossary_dict, {})
                 pattern_parts.append(f"{form} [{cleaned_value}]")
         return "{{count, plural, {0}}}".format(" ".join(pattern_parts))
     else:
-        return clean_string(trans_data['value'], False, glossary_dict, {})
+        return clean_string(value, False, glossary_dict, {})
 
 
 def get_output_locale(locale: str, two_letter_code: str) -> str:
@@ -70,7 +68,7 @@ def get_output_locale(locale: str, two_letter_code: str) -> str:
 
 
 def convert_locale_to_json(
-    translations: Dict[str, Any],
+    translations: Dict[str, List[Any]],
     glossary_dict: Dict[str, str],
     output_dir: str,
     locale: str,
@@ -80,7 +78,7 @@ def convert_locale_to_json(
     Convert translations for a single locale to JSON format.
     
     Args:
-        translations: Dictionary of translations for this locale
+        translations: Parsed translations for this locale
         glossary_dict: Dictionary of non-translatable strings
         output_dir: Base output directory
         locale: Full locale code
@@ -89,11 +87,11 @@ def convert_locale_to_json(
     Returns:
         The output locale name used
     """
-    sorted_translations = sorted(translations.items())
+    sorted_translations = sorted(iter_translations(translations), key=lambda entry: entry[0])
     converted_translations = {}
     
-    for resname, trans_data in sorted_translations:
-        converted_translations[resname] = generate_icu_pattern(trans_data, glossary_dict)
+    for resname, trans_type, trans_value in sorted_translations:
+        converted_translations[resname] = generate_icu_pattern(trans_value, glossary_dict, trans_type == 'plural')
     
     # Add glossary items (converted to camelCase)
     for resname, text in glossary_dict.items():
@@ -7,6 +7,7 @@ from datetime import datetime
 from typing import Dict, Any
 from generate_shared import (
     load_parsed_translations,
+    iter_translations,
     load_glossary_dict,
     clean_string,
     print_progress,
@@ -97,15 +98,15 @@ def build_string_catalog(parsed_data: Dict[str, Any], glossary_dict: Dict[str, s
         
         print_progress(f"Converting translations for {target_language} to target format...")
         
-        for resname, trans_data in translations.items():
+        for resname, trans_type, trans_value in iter_translations(translations):
             if resname not in string_catalog["strings"]:
                 string_catalog["strings"][resname] = {
                     "extractionState": "manual",
                     "localizations": {}
                 }
             
-            if trans_data['type'] == 'plural':
-                forms = trans_data['forms']
+            if trans_type == 'plural':
+                forms = trans_value
                 converted_forms = convert_placeholders_for_plurals(forms, glossary_dict)
                 
                 # Check if any of the translations contain '{count}'
@@ -152,12 +153,11 @@ def build_string_catalog(parsed_data: Dict[str, Any], glossary_dict: Dict[str, s
                     }
             else:
                 # Regular string
-                value = trans_data['value']
                 string_catalog["strings"][resname]["localizations"][target_language] = {
                     "stringUnit": {
                         "state": "translated",
                         "value": clean_string(
-                            value, 
+                            trans_value, 
                             False, 
                             glossary_dict if AUTO_REPLACE_STATIC_STRINGS else {}, 
                             {}
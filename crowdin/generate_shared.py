@@ -1,4 +1,4 @@
-from typing import Dict, List, Any
+from typing import Dict, Iterator, List, Any, Tuple
 import html
 import json
 import os
@@ -71,6 +71,22 @@ def load_parsed_translations(input_file: str) -> Dict[str, Any]:
         return json.load(f)
 
 
+def iter_translations(translations: Dict[str, List[Any]]) -> Iterator[Tuple[str, str, Any]]:
+    """
+    Iterate over the translations for a single locale.
+    
+    Translations are stored as parallel 'keys', 'types' and 'values' lists rather than a dict per
+    entry. For a 'plural' type the value is a dict of plural forms instead of a string.
+    
+    Args:
+        translations: The 'translations' entry of a parsed locale
+        
+    Returns:
+        Iterator of (resname, type, value) tuples
+    """
+    return zip(translations['keys'], translations['types'], translations['values'])
+
+
 def clean_string(text: str, is_android: bool, glossary_dict: Dict[str, str], extra_replace_dict: Dict[str, str]):
     if is_android:
         # Note: any changes done for all platforms needs most likely to be done on crowdin side.
@@ -1,16 +1,70 @@
 import os
+import hashlib
+import time
+import concurrent.futures
 import json
-import xml.etree.ElementTree as ET
 import sys
 import argparse
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterable, List, Any, Optional, Tuple
 from colorama import Fore, Style
+try:
+    from lxml import etree as ET
+    LXML_AVAILABLE = True
+except ImportError:
+    # Fall back to the pure-Python parser where lxml is unavailable (e.g. PyPy)
+    import xml.etree.ElementTree as ET
+    LXML_AVAILABLE = False
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from generate_shared import setup_generation, load_glossary_dict
 
 XLIFF_NAMESPACE = {'ns': 'urn:oasis:names:tc:xliff:document:1.2'}
 
+# Fully qualified tag names so lookups don't need to resolve the namespace prefix each time
+TAG_FILE = f"{{{XLIFF_NAMESPACE['ns']}}}file"
+TAG_GROUP = f"{{{XLIFF_NAMESPACE['ns']}}}group"
+TAG_TRANS_UNIT = f"{{{XLIFF_NAMESPACE['ns']}}}trans-unit"
+TAG_TARGET = f"{{{XLIFF_NAMESPACE['ns']}}}target"
+TAG_SOURCE = f"{{{XLIFF_NAMESPACE['ns']}}}source"
+TAG_CONTEXT_GROUP = f"{{{XLIFF_NAMESPACE['ns']}}}context-group"
+TAG_CONTEXT = f"{{{XLIFF_NAMESPACE['ns']}}}context"
 
-def validate_translations(translations: Dict[str, Any], locale: str) -> List[str]:
+# Skip parser work we don't need (entity resolution and id indexing) and lift libxml2's size
+# limits so large XLIFF files can be parsed, these options are only supported by lxml
+_ITERPARSE_OPTIONS = {
+    'huge_tree': True,
+    'collect_ids': False,
+    'resolve_entities': False
+} if LXML_AVAILABLE else {}
+
+# lxml can skip reporting the elements we never look at directly (sources, targets, contexts, etc.),
+# the stdlib parser doesn't support filtering so reports every element
+_ITERPARSE_TAGS = {'tag': (TAG_FILE, TAG_GROUP, TAG_TRANS_UNIT)} if LXML_AVAILABLE else {}
+
+_PROGRESS_FMT = f"\033[2K{Fore.WHITE}⏳ Parsing locales ({{}}/{{}})...{Style.RESET_ALL}\r"
+_PROGRESS_INTERVAL = 0.05  # seconds
+
+_PARSE_CACHE_DIR = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+    'session-shared-scripts',
+    'xliff_parse'
+)
+
+
+def _hash_parser_source() -> str:
+    """Hash the contents of this file so any change to the parsing code invalidates cached results."""
+    with open(__file__, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+# The parsing code, parser backend and its options can all affect the parsed output so cached
+# results are keyed on them as well as the file being parsed
+_PARSER_SIGNATURE = f"{_hash_parser_source()}|{'lxml' if LXML_AVAILABLE else 'stdlib'}|{sorted(_ITERPARSE_OPTIONS.items())}"
+
+
+def validate_translations(translations: Dict[str, List[Any]], locale: str) -> List[str]:
     """
     Validate parsed translations for a given locale.
     
@@ -30,99 +84,251 @@ def validate_translations(translations: Dict[str, Any], locale: str) -> List[str
     return warnings
 
 
-def parse_xliff_file(file_path: str, warn_on_missing_target: bool = True) -> Dict[str, Any]:
+def _release_element(elem) -> None:
+    """
+    Free a fully processed element so the streamed tree doesn't keep growing.
+
+    Under lxml the already-processed siblings preceding the element are dropped as well.
+    """
+    elem.clear()
+    if hasattr(elem, 'getprevious'):
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+
+
+def parse_xliff_file(file_path: str, use_cache: bool = True) -> Dict[str, Any]:
     """
     Parse a single XLIFF file and return translations as a dictionary.
+
+    Results are cached in the user's cache directory keyed by the file's path, modification
+    time and size (along with the parsing code and parser in use) so unchanged files don't need
+    to be parsed again on subsequent runs.
     
     Args:
         file_path: Path to the XLIFF file
-        warn_on_missing_target: If True, print warnings when target is missing and source is used
+        use_cache: If False, always parse the file and don't read or write the cache
         
     Returns:
-        Dictionary with 'translations' and 'target_language' keys
+        Dictionary with 'translations', 'target_language' and 'warnings' keys. The 'translations'
+        are stored as parallel 'keys', 'types' and 'values' lists, where each type is either
+        'string' (value is the translated string) or 'plural' (value is a dict mapping each
+        plural form to its string), and are written to the intermediate JSON in that form.
     """
-    tree = ET.parse(file_path)
-    root = tree.getroot()
-    translations = {}
+    if not use_cache:
+        return _parse_xliff_stream(file_path)
 
-    file_elem = root.find('ns:file', namespaces=XLIFF_NAMESPACE)
-    if file_elem is None:
-        raise ValueError(f"Invalid XLIFF structure in file: {file_path}")
+    st = os.stat(file_path)
+    abs_path = os.path.abspath(file_path)
+    cache_key = f"{_PARSER_SIGNATURE}|{st.st_mtime_ns}|{st.st_size}"
 
-    target_language = file_elem.get('target-language')
-    if target_language is None:
-        raise ValueError(f"Missing target-language in file: {file_path}")
+    # Each file has a single cache entry which is overwritten whenever it's parsed again
+    cache_file = os.path.join(_PARSE_CACHE_DIR, f"{hashlib.sha1(abs_path.encode()).hexdigest()}.json")
 
-    # Handle plural groups first
-    for group in root.findall('.//ns:group[@restype="x-gettext-plurals"]', namespaces=XLIFF_NAMESPACE):
-        plural_forms = {}
-        resname = None
-        
-        for trans_unit in group.findall('ns:trans-unit', namespaces=XLIFF_NAMESPACE):
-            if resname is None:
-                resname = trans_unit.get('resname') or trans_unit.get('id')
-
-            target = trans_unit.find('ns:target', namespaces=XLIFF_NAMESPACE)
-            source = trans_unit.find('ns:source', namespaces=XLIFF_NAMESPACE)
-            context_group = trans_unit.find('ns:context-group', namespaces=XLIFF_NAMESPACE)
-
-            if context_group is not None:
-                plural_form_elem = context_group.find(
-                    'ns:context[@context-type="x-plural-form"]', 
-                    namespaces=XLIFF_NAMESPACE
-                )
-                if plural_form_elem is not None:
-                    form = plural_form_elem.text.split(':')[-1].strip().lower()
-
-                    if target is not None and target.text:
-                        plural_forms[form] = target.text
-                    elif source is not None and source.text:
-                        plural_forms[form] = source.text
-                        if warn_on_missing_target:
-                            print(f"Warning: Using source text for plural form '{form}' of "
-                                  f"'{resname}' in '{target_language}' as target is missing or empty")
-
-        if resname and plural_forms:
-            translations[resname] = {
-                'type': 'plural',
-                'forms': plural_forms
-            }
-
-    # Handle non-plural translations (skip entries already processed as plurals)
-    for trans_unit in root.findall('.//ns:trans-unit', namespaces=XLIFF_NAMESPACE):
+    if os.path.exists(cache_file):
+        try:
+            with open(cache_file, 'rb') as f:
+                raw = f.read()
+            entry = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            if entry.get('path') == abs_path and entry.get('key') == cache_key:
+                return entry['result']
+        except Exception:
+            # A corrupt or unreadable cache entry just means we parse the file again
+            pass
+
+    result = _parse_xliff_stream(file_path)
+
+    try:
+        os.makedirs(_PARSE_CACHE_DIR, mode=0o700, exist_ok=True)
+        entry = {'path': abs_path, 'key': cache_key, 'result': result}
+        tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+        with open(tmp_file, 'wb') as f:
+            f.write(orjson.dumps(entry) if orjson is not None else json.dumps(entry, ensure_ascii=False).encode('utf-8'))
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        # Failing to write the cache shouldn't fail the parse
+        pass
+
+    return result
+
+
+def _fallback_to_source(trans_unit, resname: str, target_language: str, warnings: List[str]) -> Optional[str]:
+    """
+    Get the source text for a trans-unit whose target is missing or empty.
+
+    A warning is recorded when the source text is used in place of the target.
+    """
+    source = trans_unit.find(TAG_SOURCE)
+    source_text = source.text if source is not None else None
+    if source_text:
+        warnings.append(f"Using source text for '{resname}' in "
+                        f"'{target_language}' as target is missing or empty")
+    return source_text
+
+
+def _parse_xliff_stream(file_path: str) -> Dict[str, Any]:
+    """
+    Parse a single XLIFF file without consulting the cache.
+
+    The file is streamed in a single pass, each trans-unit (or plural group) is
+    released as soon as it has been processed to keep memory usage bounded.
+    """
+    # Translations are stored as parallel lists (see `iter_translations`), `positions` maps
+    # each resname to its index in those lists
+    keys = []
+    types = []
+    values = []
+    positions = {}
+    warnings = []
+    target_language = None
+    plural_depth = 0
+
+    def add_string(trans_unit) -> None:
         resname = trans_unit.get('resname') or trans_unit.get('id')
-        if resname is None or resname in translations:
+        if resname is None or resname in positions:
+            return
+
+        # Most trans-units have a target so only look up the source when it's missing
+        target = trans_unit.find(TAG_TARGET)
+        if target is None or not (value := target.text):
+            value = _fallback_to_source(trans_unit, resname, target_language, warnings)
+
+        if value:
+            positions[resname] = len(keys)
+            keys.append(resname)
+            types.append('string')
+            values.append(value)
+
+    for event, elem in ET.iterparse(file_path, events=('start', 'end'), **_ITERPARSE_TAGS, **_ITERPARSE_OPTIONS):
+        tag = elem.tag
+
+        if event == 'start':
+            if tag == TAG_FILE and target_language is None:
+                target_language = elem.get('target-language')
+                if target_language is None:
+                    raise ValueError(f"Missing target-language in file: {file_path}")
+            elif tag == TAG_GROUP and elem.get('restype') == 'x-gettext-plurals':
+                plural_depth += 1
             continue
 
-        target = trans_unit.find('ns:target', namespaces=XLIFF_NAMESPACE)
-        source = trans_unit.find('ns:source', namespaces=XLIFF_NAMESPACE)
-
-        if target is not None and target.text:
-            translations[resname] = {
-                'type': 'string',
-                'value': target.text
-            }
-        elif source is not None and source.text:
-            translations[resname] = {
-                'type': 'string',
-                'value': source.text
-            }
-            if warn_on_missing_target:
-                print(f"Warning: Using source text for '{resname}' in "
-                      f"'{target_language}' as target is missing or empty")
+        if tag == TAG_GROUP and elem.get('restype') == 'x-gettext-plurals':
+            plural_depth -= 1
+            plural_forms = {}
+            found_form = False
+            resname = None
+            group_trans_units = []
+
+            # Walk the direct children rather than running a selector query for every group
+            for trans_unit in elem:
+                if trans_unit.tag != TAG_TRANS_UNIT:
+                    continue
+
+                group_trans_units.append(trans_unit)
+                if resname is None:
+                    resname = trans_unit.get('resname') or trans_unit.get('id')
+
+                # Collect everything needed from the trans-unit in a single pass over its children
+                target_text = None
+                source_text = None
+                form = None
+
+                for child in trans_unit:
+                    child_tag = child.tag
+                    if child_tag == TAG_TARGET:
+                        target_text = child.text
+                    elif child_tag == TAG_SOURCE:
+                        source_text = child.text
+                    elif child_tag == TAG_CONTEXT_GROUP and form is None:
+                        for context in child:
+                            if context.tag == TAG_CONTEXT and context.get('context-type') == 'x-plural-form':
+                                # There are only a handful of plural form names so share a single instance of each
+                                form = sys.intern(context.text.split(':')[-1].strip().lower())
+                                break
+
+                if form is None:
+                    continue
+
+                found_form = True
+                value = target_text or source_text
+                if not value:
+                    continue
+
+                plural_forms[form] = value
+                if not target_text:
+                    warnings.append(f"Using source text for plural form '{form}' of "
+                                    f"'{resname}' in '{target_language}' as target is missing or empty")
+
+            # Plurals take precedence over any non-plural entry sharing the same resname
+            if resname and plural_forms:
+                position = positions.get(resname)
+                if position is None:
+                    positions[resname] = len(keys)
+                    keys.append(resname)
+                    types.append('plural')
+                    values.append(plural_forms)
+                else:
+                    types[position] = 'plural'
+                    values[position] = plural_forms
+            elif group_trans_units and not found_form:
+                warnings.append(f"No plural forms found for '{resname}' in '{target_language}', "
+                                f"treating its trans-units as regular strings")
+
+            # Any trans-units which weren't consumed as plural forms are treated as regular strings
+            for trans_unit in group_trans_units:
+                add_string(trans_unit)
+
+            _release_element(elem)
+
+        # Trans-units within a plural group are handled when the group closes so they are never
+        # visited here, only the first of any duplicated resnames is kept
+        elif tag == TAG_TRANS_UNIT and plural_depth == 0:
+            add_string(elem)
+            _release_element(elem)
+
+    if target_language is None:
+        raise ValueError(f"Invalid XLIFF structure in file: {file_path}")
 
     return {
-        'translations': translations,
-        'target_language': target_language
+        'translations': {
+            'keys': keys,
+            'types': types,
+            'values': values
+        },
+        'target_language': target_language,
+        'warnings': warnings
     }
 
 
-def parse_all_xliff_files(input_directory: str) -> Dict[str, Any]:
+def _parse_one(job: Tuple[str, str, bool]) -> Tuple[str, Dict[str, Any], List[str]]:
+    """
+    Parse and validate the XLIFF file for a single locale.
+    
+    Args:
+        job: Tuple of the locale, the path to its XLIFF file and whether to use the parse cache
+        
+    Returns:
+        Tuple of the locale, the parsed result and any parsing or validation warnings
+    """
+    lang_locale, input_file, use_cache = job
+    
+    if not os.path.exists(input_file):
+        raise FileNotFoundError(f"Could not find '{input_file}' in raw translations directory")
+    
+    try:
+        result = parse_xliff_file(input_file, use_cache)
+        warnings = result['warnings'] + validate_translations(result['translations'], lang_locale)
+    except Exception as e:
+        raise ValueError(f"Error processing locale {lang_locale}: {str(e)}")
+    
+    return lang_locale, result, warnings
+
+
+def parse_all_xliff_files(input_directory: str, use_cache: bool = True) -> Dict[str, Any]:
     """
     Parse all XLIFF files in the input directory and return a combined result.
     
     Args:
         input_directory: Directory containing XLIFF files and project info
+        use_cache: If False, parse every file without reading or writing the parse cache
         
     Returns:
         Dictionary containing all parsed data ready for platform-specific generators
@@ -136,42 +342,52 @@ def parse_all_xliff_files(input_directory: str) -> Dict[str, Any]:
     glossary_dict = load_glossary_dict(non_translatable_strings_file)
     
     all_languages = [source_language] + target_languages
+    jobs = [
+        (language['locale'], os.path.join(input_directory, f"{language['locale']}.xliff"), language)
+        for language in all_languages
+    ]
+    parsed_results = {}
+    last_progress_time = 0.0
+    
+    # Locales are independent of each other so parse them in parallel
+    with concurrent.futures.ProcessPoolExecutor() as executor:
+        futures = [
+            executor.submit(_parse_one, (lang_locale, input_file, use_cache))
+            for lang_locale, input_file, _ in jobs
+        ]
+        
+        for future in concurrent.futures.as_completed(futures):
+            lang_locale, result, warnings = future.result()
+            parsed_results[lang_locale] = (result, warnings)
+            
+            # Throttle progress updates so terminal output doesn't hold up collecting results
+            now = time.monotonic()
+            if now - last_progress_time >= _PROGRESS_INTERVAL or len(parsed_results) == len(jobs):
+                sys.stdout.write(_PROGRESS_FMT.format(len(parsed_results), len(jobs)))
+                sys.stdout.flush()
+                last_progress_time = now
+    
+    # Assemble the results in the original language order so the output is deterministic
     parsed_locales = {}
     all_warnings = []
     
-    for language in all_languages:
-        lang_locale = language['locale']
-        input_file = os.path.join(input_directory, f"{lang_locale}.xliff")
+    for lang_locale, _, language in jobs:
+        result, warnings = parsed_results[lang_locale]
         
-        if not os.path.exists(input_file):
-            raise FileNotFoundError(f"Could not find '{input_file}' in raw translations directory")
+        if warnings:
+            all_warnings.extend([(lang_locale, w) for w in warnings])
         
-        print(f"\033[2K{Fore.WHITE}⏳ Parsing {lang_locale}...{Style.RESET_ALL}", end='\r')
-        
-        try:
-            result = parse_xliff_file(input_file)
-            translations = result['translations']
-            target_language = result['target_language']
-            
-            # Run validation
-            warnings = validate_translations(translations, lang_locale)
-            if warnings:
-                all_warnings.extend([(lang_locale, w) for w in warnings])
-            
-            parsed_locales[lang_locale] = {
-                'target_language': target_language,
-                'translations': translations,
-                'language_info': language
-            }
-            
-        except Exception as e:
-            raise ValueError(f"Error processing locale {lang_locale}: {str(e)}")
+        parsed_locales[lang_locale] = {
+            'target_language': result['target_language'],
+            'translations': result['translations'],
+            'language_info': language
+        }
     
     print(f"\033[2K{Fore.GREEN}✅ Parsed {len(parsed_locales)} locale files{Style.RESET_ALL}")
     
-    # Print any validation warnings
+    # Print any parsing and validation warnings
     if all_warnings:
-        print(f"{Fore.YELLOW}⚠️  Validation warnings:{Style.RESET_ALL}")
+        print(f"{Fore.YELLOW}⚠️  Warnings:{Style.RESET_ALL}")
         for locale, warning in all_warnings:
             print(f"  [{locale}] {warning}")
     
@@ -184,6 +400,47 @@ def parse_all_xliff_files(input_directory: str) -> Dict[str, Any]:
     }
 
 
+def _to_json(value: Any, depth: int) -> str:
+    """Serialize a value as indented JSON for nesting `depth` levels deep within the output file."""
+    if orjson is not None:
+        text = orjson.dumps(value, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    else:
+        text = json.dumps(value, ensure_ascii=False, indent=2)
+
+    # JSON strings can't contain raw newlines so this only affects the formatting
+    return text.replace('\n', '\n' + '  ' * depth)
+
+
+def write_parsed_translations(
+    parsed_data: Dict[str, Any],
+    locales: Iterable[Tuple[str, Dict[str, Any]]],
+    output_file: str
+):
+    """
+    Write the combined parse result to a JSON file.
+
+    Locales are serialized and written one at a time so the encoded output for every
+    locale never needs to be held in memory at once.
+    
+    Args:
+        parsed_data: The result of `parse_all_xliff_files` excluding its 'locales'
+        locales: The (locale, locale data) pairs to write under 'locales'
+        output_file: Path to save the parsed translations JSON file
+    """
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write('{')
+
+        for key, value in parsed_data.items():
+            f.write(f"\n  {_to_json(key, 1)}: {_to_json(value, 1)},")
+
+        f.write('\n  "locales": {')
+        has_locales = False
+        for locale, locale_data in locales:
+            f.write(f"{',' if has_locales else ''}\n    {_to_json(locale, 2)}: {_to_json(locale_data, 2)}")
+            has_locales = True
+        f.write('\n  }\n}' if has_locales else '}\n}')
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Parse XLIFF translation files into an intermediate JSON format'
@@ -196,15 +453,25 @@ def main():
         'output_file',
         help='Path to save the parsed translations JSON file'
     )
+    parser.add_argument(
+        '--no-cache',
+        help='Parse every file without reading or writing the parse cache',
+        action='store_true'
+    )
     args = parser.parse_args()
     
     try:
-        result = parse_all_xliff_files(args.raw_translations_directory)
+        result = parse_all_xliff_files(args.raw_translations_directory, not args.no_cache)
         
         # Write output
         os.makedirs(os.path.dirname(args.output_file) or '.', exist_ok=True)
-        with open(args.output_file, 'w', encoding='utf-8') as f:
-            json.dump(result, f, ensure_ascii=False, indent=2)
+        # Hand the locales over as they are written so each can be freed once it's on disk
+        locales = result.pop('locales')
+        write_parsed_translations(
+            result,
+            ((locale, locales.pop(locale)) for locale in list(locales)),
+            args.output_file
+        )
         
         print(f"{Fore.GREEN}✅ Parsed translations saved to {args.output_file}{Style.RESET_ALL}")
         